@@ -7,16 +7,33 @@ for Today, This Week, and This Month.
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import NamedTuple
 
+from claude_usage.cache import load_cache, save_cache
 from claude_usage.format import render_daily_table, render_model_table, render_summary_table
+from claude_usage.message import UsageMessage
+
+# orjson decodes bytes directly and is several times faster than the stdlib parser on
+# large session histories. Its JSONDecodeError subclasses json.JSONDecodeError, so the
+# same except clause covers both.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Pricing per million tokens (5-minute cache write rate; cache reads are 0.1x input).
-# More-specific prefixes must come before less-specific ones — get_model_pricing()
-# returns on the first match.
+# Keys are model-name prefixes; get_model_pricing() tries the longest prefixes first.
 PRICING = {
     # Opus 4.5+ dropped to $5/$25; original Opus 4 and 4.1 remain at $15/$75.
     "claude-opus-4-6": {
@@ -72,71 +89,240 @@ _LONG_CONTEXT_PRICING: dict[str, dict[str, float]] = {
     },
 }
 
+# Prefix lookup tables ordered longest-prefix-first, so the first startswith() hit is the
+# most specific match regardless of dict order above.
+_PRICING_TABLE = tuple(sorted(PRICING.items(), key=lambda item: -len(item[0])))
+_LONG_CONTEXT_PRICING_TABLE = tuple(
+    sorted(_LONG_CONTEXT_PRICING.items(), key=lambda item: -len(item[0]))
+)
+
+# Claude JSONL timestamps: group 1 is the fractional seconds, group 2 the trailing Z.
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.(\d+))?(Z)?")
+
+# Below this many files, process pool startup costs more than parsing serially.
+_PARALLEL_MIN_FILES = 4
+
+# Files (or unread tails) up to this size are read in one go and split in memory.
+_READ_ALL_MAX_BYTES = 100 * 1024 * 1024
 
+# Every assistant entry contains this token (as its "type" value), so lines without it can be
+# skipped before decoding. Matching the bare value rather than '"type":"assistant"' keeps the
+# check independent of the writer's whitespace; the full type check still runs after decode.
+_ASSISTANT_MARKER = b'"assistant"'
+
+
+@functools.lru_cache(maxsize=128)
 def get_model_pricing(model_name: str) -> dict[str, float] | None:
     """Get pricing for a model by matching prefix."""
-    for prefix, pricing in PRICING.items():
+    for prefix, pricing in _PRICING_TABLE:
+        if model_name.startswith(prefix):
+            return pricing
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _get_long_context_pricing(model_name: str) -> dict[str, float] | None:
+    """Get long-context pricing for a model by matching prefix, if it has any."""
+    for prefix, pricing in _LONG_CONTEXT_PRICING_TABLE:
         if model_name.startswith(prefix):
             return pricing
     return None
 
 
-def parse_jsonl_file(file_path: Path) -> list[dict]:
-    """Parse a JSONL file and extract assistant messages with usage."""
-    messages = []
+@functools.lru_cache(maxsize=128)
+def _get_token_rates(
+    model_name: str, long_context: bool = False
+) -> tuple[float, float, float, float] | None:
+    """
+    Get per-token (input, output, cache_write, cache_read) rates for a model.
+    Prices are per million tokens; dividing once here saves four divisions per message.
+    """
+    pricing = get_model_pricing(model_name)
+    if long_context:
+        pricing = _get_long_context_pricing(model_name) or pricing
+    if not pricing:
+        return None
+
+    return (
+        pricing["input"] / 1_000_000,
+        pricing["output"] / 1_000_000,
+        pricing["cache_write"] / 1_000_000,
+        pricing["cache_read"] / 1_000_000,
+    )
+
+
+def find_jsonl_files(root: Path) -> Iterator[str]:
+    """
+    Yield the path of every *.jsonl file under root.
+
+    Walks the tree with os.scandir, which reuses the file type from the directory listing
+    and tests names as plain strings, instead of building a Path for every entry.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable or vanished directories are skipped, as Path.glob does
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    stack.append(entry.path)
+                elif entry.name.endswith(".jsonl"):
+                    yield entry.path
+
+
+def parse_jsonl_file(
+    file_path: str | Path, offset: int = 0
+) -> tuple[dict[tuple, UsageMessage], int]:
+    """
+    Parse a JSONL file from byte offset onwards and extract assistant messages with usage,
+    keyed by (message_id, request_id). Streaming sends cumulative usage, so a later line
+    for the same key replaces the earlier one.
+
+    Returns the messages and the offset just past the last complete line, where the next
+    incremental parse should resume.
+    """
+    messages = {}
+    end_offset = offset
 
     try:
-        with open(file_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            if os.fstat(f.fileno()).st_size - offset > _READ_ALL_MAX_BYTES:
+                # Stream very large files to cap memory use
+                lines = f
+            else:
+                # One read and a C-level split beat Python-side buffered line iteration
+                lines = f.read().split(b"\n")
+
+            line = b""
+            for line in lines:
+                # Most lines are user messages and tool results; skip them before any
+                # copying or decoding. Blank lines fail this test too, and the JSON parser
+                # ignores the trailing newline, so lines are never stripped.
+                if _ASSISTANT_MARKER not in line:
                     continue
 
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
 
                     # Only process assistant messages with usage data
                     if entry.get("type") == "assistant" and "message" in entry:
                         message = entry["message"]
                         if "usage" in message:
-                            messages.append(
-                                {
-                                    "timestamp": entry.get("timestamp"),
-                                    "request_id": entry.get("requestId"),
-                                    "message_id": message.get("id"),
-                                    "model": message.get("model"),
-                                    "usage": message["usage"],
-                                }
+                            message_id = message.get("id")
+                            request_id = entry.get("requestId")
+                            messages[(message_id, request_id)] = UsageMessage(
+                                timestamp=entry.get("timestamp"),
+                                request_id=request_id,
+                                message_id=message_id,
+                                model=message.get("model"),
+                                usage=message["usage"],
                             )
                 except json.JSONDecodeError:
                     # Skip malformed lines
                     continue
 
+            # Resume before a trailing partial line, which may still be being written. The
+            # last line is either newline-terminated (streamed) or whatever followed the
+            # final newline (split in memory, so empty when the file ends cleanly).
+            end_offset = f.tell()
+            if not line.endswith(b"\n"):
+                end_offset -= len(line)
+
     except Exception as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
 
-    return messages
+    return messages, end_offset
+
+
+def parse_jsonl_files(jsonl_files: list[str], cached_files: dict[str, dict]) -> dict[str, dict]:
+    """
+    Parse every JSONL file, reusing cached results for files that haven't changed and
+    only reading the appended tail of files that have grown.
+
+    Returns cache entries ({"offset", "mtime_ns", "messages"}) keyed by file path, in
+    the same order as jsonl_files.
+    """
+    entries: dict[str, dict] = {}
+    readable = []  # keys of files that could be stat'ed, in jsonl_files order
+    pending = []  # (key, offset, cached entry to extend, mtime_ns)
+
+    for key in jsonl_files:
+        try:
+            stat = os.stat(key)
+        except OSError as e:
+            print(f"Error reading {key}: {e}", file=sys.stderr)
+            continue
+
+        readable.append(key)
+        cached = cached_files.get(key)
+        if cached is not None:
+            if stat.st_size == cached["offset"] and stat.st_mtime_ns == cached["mtime_ns"]:
+                entries[key] = cached
+                continue
+            if stat.st_size > cached["offset"]:
+                # Session files are append-only, so only the tail needs reading
+                pending.append((key, cached["offset"], cached, stat.st_mtime_ns))
+                continue
+
+        # New, truncated or rewritten file
+        pending.append((key, 0, None, stat.st_mtime_ns))
+
+    paths = [key for key, _, _, _ in pending]
+    offsets = [offset for _, offset, _, _ in pending]
+
+    # Each file is independent, so fan out across cores
+    if len(pending) < _PARALLEL_MIN_FILES:
+        results = list(map(parse_jsonl_file, paths, offsets))
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(parse_jsonl_file, paths, offsets, chunksize=8))
+
+    for (key, _, cached, mtime_ns), (messages, end_offset) in zip(pending, results, strict=True):
+        if cached is not None:
+            messages = {**cached["messages"], **messages}
+        entries[key] = {"offset": end_offset, "mtime_ns": mtime_ns, "messages": messages}
 
+    # File order decides which duplicate wins when the results are merged
+    return {key: entries[key] for key in readable}
 
-def deduplicate_messages(messages: list[dict]) -> list[dict]:
+
+def deduplicate_messages(
+    parsed_files: Iterable[dict[tuple, UsageMessage]],
+) -> list[UsageMessage]:
     """
-    Deduplicate messages by keeping only the last occurrence of each
-    (message_id, request_id) pair, since streaming sends cumulative usage.
+    Merge per-file results from parse_jsonl_file(), keeping only the last occurrence of
+    each (message_id, request_id) pair, since streaming sends cumulative usage.
     """
-    # Build a dict keyed by (message_id, request_id)
     unique_messages = {}
 
-    for msg in messages:
-        key = (msg["message_id"], msg["request_id"])
-        unique_messages[key] = msg
+    for messages in parsed_files:
+        unique_messages.update(messages)
 
     return list(unique_messages.values())
 
 
+def _cache_write_tokens(usage: dict) -> int:
+    """Cache write tokens from either usage schema (top-level or nested)."""
+    cache_write = usage.get("cache_creation_input_tokens", 0)
+    if cache_write == 0 and "cache_creation" in usage:
+        cache_creation = usage["cache_creation"]
+        cache_write = cache_creation.get("ephemeral_5m_input_tokens", 0)
+        cache_write += cache_creation.get("ephemeral_1h_input_tokens", 0)
+    return cache_write
+
+
 def calculate_cost(usage: dict, model: str) -> float:
     """Calculate cost for a usage entry based on model pricing."""
-    pricing = get_model_pricing(model)
-    if not pricing:
+    rates = _get_token_rates(model)
+    if not rates:
         return 0.0
 
     # Switch to long-context rates if total input exceeds 200K tokens.
@@ -145,39 +331,160 @@ def calculate_cost(usage: dict, model: str) -> float:
         + usage.get("cache_creation_input_tokens", 0)
         + usage.get("cache_read_input_tokens", 0)
     )
-    for prefix, lc_pricing in _LONG_CONTEXT_PRICING.items():
-        if model.startswith(prefix) and total_input > _LONG_CONTEXT_THRESHOLD:
-            pricing = lc_pricing
-            break
+    if total_input > _LONG_CONTEXT_THRESHOLD:
+        rates = _get_token_rates(model, long_context=True) or rates
 
-    cost = 0.0
+    input_rate, output_rate, cache_write_rate, cache_read_rate = rates
 
     # Input tokens (non-cached)
     input_tokens = usage.get("input_tokens", 0)
-    cost += (input_tokens / 1_000_000) * pricing["input"]
 
     # Output tokens
     output_tokens = usage.get("output_tokens", 0)
-    cost += (output_tokens / 1_000_000) * pricing["output"]
 
     # Cache write tokens (can be at top level or nested)
-    cache_write = usage.get("cache_creation_input_tokens", 0)
-    if cache_write == 0 and "cache_creation" in usage:
-        # Try nested structure
-        cache_creation = usage["cache_creation"]
-        cache_write = cache_creation.get("ephemeral_5m_input_tokens", 0)
-        cache_write += cache_creation.get("ephemeral_1h_input_tokens", 0)
-    cost += (cache_write / 1_000_000) * pricing["cache_write"]
+    cache_write = _cache_write_tokens(usage)
 
     # Cache read tokens
     cache_read = usage.get("cache_read_input_tokens", 0)
-    cost += (cache_read / 1_000_000) * pricing["cache_read"]
 
-    return cost
+    return (
+        input_tokens * input_rate
+        + output_tokens * output_rate
+        + cache_write * cache_write_rate
+        + cache_read * cache_read_rate
+    )
+
+
+def _parse_claude_ts(timestamp_str: str) -> datetime | None:
+    """
+    Parse a JSONL timestamp into an aware UTC datetime, or None if it is malformed.
+
+    Claude writes timestamps as YYYY-MM-DDTHH:MM:SS[.fff]Z, so once the pattern matches,
+    the fields sit at fixed offsets and can be sliced out directly; other ISO 8601 forms
+    (e.g. explicit offsets) go through fromisoformat().
+    """
+    match = _TIMESTAMP_RE.match(timestamp_str)
+    if match is None:
+        return None
+
+    if match.end() != len(timestamp_str) or match.group(2) is None:
+        return datetime.fromisoformat(timestamp_str).astimezone(UTC)
+
+    fraction = match.group(1)
+    return datetime(
+        int(timestamp_str[0:4]),
+        int(timestamp_str[5:7]),
+        int(timestamp_str[8:10]),
+        int(timestamp_str[11:13]),
+        int(timestamp_str[14:16]),
+        int(timestamp_str[17:19]),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tzinfo=UTC,
+    )
+
+
+# Timestamp column value for messages whose timestamp is missing or invalid; it compares
+# below every period boundary, so those messages drop out of period and day views.
+_NO_TIMESTAMP = float("-inf")
+
+# Stand-in per-token rates for models missing from PRICING
+_NO_RATES = (0.0, 0.0, 0.0, 0.0)
+
+
+class ScoredMessages(NamedTuple):
+    """
+    Token counts and costs for every message, computed once per run and stored column-wise.
+    Row i of each column describes the same message; rows are ordered by timestamp.
+    """
+
+    timestamps: array  # UTC epoch seconds (float)
+    models: list[str | None]
+    input_tokens: array
+    output_tokens: array
+    cache_write_tokens: array
+    cache_read_tokens: array
+    input_costs: array
+    output_costs: array
+    cache_costs: array
+
+
+def score_messages(messages: list[UsageMessage]) -> ScoredMessages:
+    """
+    Parse timestamps and price every message in a single pass, so each period, day and
+    model breakdown only has to sum the precomputed columns.
+    """
+    scored = ScoredMessages(
+        timestamps=array("d"),
+        models=[],
+        input_tokens=array("q"),
+        output_tokens=array("q"),
+        cache_write_tokens=array("q"),
+        cache_read_tokens=array("q"),
+        input_costs=array("d"),
+        output_costs=array("d"),
+        cache_costs=array("d"),
+    )
+
+    for msg in messages:
+        usage = msg.usage
+        model = msg.model
+
+        timestamp_str = msg.timestamp
+        try:
+            timestamp = _parse_claude_ts(timestamp_str) if timestamp_str else None
+        except (TypeError, ValueError, OverflowError):
+            timestamp = None
+
+        rates = _get_token_rates(model)
+        if rates:
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+
+            # Handle cache write tokens (can be at top level or nested)
+            cache_write = _cache_write_tokens(usage)
+
+            cache_read = usage.get("cache_read_input_tokens", 0)
+        else:
+            # Unpriced models still count as messages but add no tokens or cost
+            rates = _NO_RATES
+            input_tokens = output_tokens = cache_write = cache_read = 0
+
+        input_rate, output_rate, cache_write_rate, cache_read_rate = rates
+        scored.timestamps.append(_NO_TIMESTAMP if timestamp is None else timestamp.timestamp())
+        scored.models.append(model)
+        scored.input_tokens.append(input_tokens)
+        scored.output_tokens.append(output_tokens)
+        scored.cache_write_tokens.append(cache_write)
+        scored.cache_read_tokens.append(cache_read)
+        scored.input_costs.append(input_tokens * input_rate)
+        scored.output_costs.append(output_tokens * output_rate)
+        scored.cache_costs.append(cache_write * cache_write_rate + cache_read * cache_read_rate)
+
+    # Ordering rows by time turns every period and day into a contiguous row range
+    order = sorted(range(len(scored.models)), key=scored.timestamps.__getitem__)
+
+    def reorder(column: array) -> array:
+        return array(column.typecode, map(column.__getitem__, order))
+
+    return ScoredMessages(
+        timestamps=reorder(scored.timestamps),
+        models=[scored.models[i] for i in order],
+        input_tokens=reorder(scored.input_tokens),
+        output_tokens=reorder(scored.output_tokens),
+        cache_write_tokens=reorder(scored.cache_write_tokens),
+        cache_read_tokens=reorder(scored.cache_read_tokens),
+        input_costs=reorder(scored.input_costs),
+        output_costs=reorder(scored.output_costs),
+        cache_costs=reorder(scored.cache_costs),
+    )
 
 
-def categorize_by_period(messages: list[dict]) -> dict[str, list[dict]]:
-    """Categorize messages by time period (today, this week, this month)."""
+def categorize_by_period(scored: ScoredMessages) -> dict[str, slice]:
+    """
+    Categorize messages by time period (today, this week, this month).
+    Returns the range of scored rows falling in each period.
+    """
     now = datetime.now().astimezone()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
@@ -187,146 +494,77 @@ def categorize_by_period(messages: list[dict]) -> dict[str, list[dict]]:
     # Month starts on the 1st
     month_start = today_start.replace(day=1)
 
-    categorized = {
-        "today": [],
-        "week": [],
-        "month": [],
+    # Rows are sorted by timestamp, so each period is the suffix starting at the first
+    # row on or after its start
+    timestamps = scored.timestamps
+    return {
+        "today": slice(bisect_left(timestamps, today_start.timestamp()), None),
+        "week": slice(bisect_left(timestamps, week_start.timestamp()), None),
+        "month": slice(bisect_left(timestamps, month_start.timestamp()), None),
     }
 
-    for msg in messages:
-        timestamp_str = msg.get("timestamp")
-        if not timestamp_str:
-            continue
-
-        try:
-            # Parse ISO 8601 timestamp
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            # Convert to local timezone
-            timestamp = timestamp.astimezone()
-
-            if timestamp >= today_start:
-                categorized["today"].append(msg)
-            if timestamp >= week_start:
-                categorized["week"].append(msg)
-            if timestamp >= month_start:
-                categorized["month"].append(msg)
-
-        except Exception:
-            # Skip messages with invalid timestamps
-            continue
 
-    return categorized
-
-
-def categorize_by_model(messages: list[dict]) -> dict[str, list[dict]]:
-    """Categorize messages by model."""
+def categorize_by_model(scored: ScoredMessages) -> dict[str | None, list[int]]:
+    """Categorize messages by model, returning the scored row indices for each model."""
     model_buckets = {}
 
-    for msg in messages:
-        model = msg.get("model", "unknown")
+    for i, model in enumerate(scored.models):
         if model not in model_buckets:
             model_buckets[model] = []
-        model_buckets[model].append(msg)
+        model_buckets[model].append(i)
 
     return model_buckets
 
 
-def categorize_by_day(messages: list[dict], days: int = 7) -> dict[str, list[dict]]:
-    """Categorize messages by individual days for the last N days."""
+def categorize_by_day(scored: ScoredMessages, days: int = 7) -> dict[str, slice]:
+    """
+    Categorize messages by individual days for the last N days.
+    Returns the range of scored rows falling on each day.
+    """
     now = datetime.now().astimezone()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # Create dict for each of the last N days
+    # Rows are sorted by timestamp, so each day is the run of rows between its start and
+    # the next day's start
+    timestamps = scored.timestamps
     daily_buckets = {}
     for i in range(days):
         day_start = today_start - timedelta(days=i)
-        day_key = day_start.strftime("%Y-%m-%d")
-        daily_buckets[day_key] = []
+        day_end = day_start + timedelta(days=1)
+        daily_buckets[day_start.strftime("%Y-%m-%d")] = slice(
+            bisect_left(timestamps, day_start.timestamp()),
+            bisect_left(timestamps, day_end.timestamp()),
+        )
 
-    for msg in messages:
-        timestamp_str = msg.get("timestamp")
-        if not timestamp_str:
-            continue
+    return daily_buckets
 
-        try:
-            # Parse ISO 8601 timestamp
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            # Convert to local timezone
-            timestamp = timestamp.astimezone()
-
-            # Find which day bucket this belongs to
-            for i in range(days):
-                day_start = today_start - timedelta(days=i)
-                day_end = day_start + timedelta(days=1)
-                if day_start <= timestamp < day_end:
-                    day_key = day_start.strftime("%Y-%m-%d")
-                    daily_buckets[day_key].append(msg)
-                    break
-
-        except Exception:
-            # Skip messages with invalid timestamps
-            continue
 
-    return daily_buckets
+def _select_rows(column: array | list, rows: slice | list[int]) -> Iterable:
+    """Pick the rows of a scored column given by a row range or a list of row indices."""
+    return column[rows] if isinstance(rows, slice) else map(column.__getitem__, rows)
 
 
-def aggregate_usage(messages: list[dict]) -> tuple[dict[str, int], dict[str, float], float]:
+def aggregate_usage(
+    scored: ScoredMessages, rows: slice | list[int]
+) -> tuple[dict[str, int], dict[str, float], float]:
     """
-    Aggregate token usage across messages and calculate total cost.
+    Aggregate token usage and costs across the scored messages selected by rows.
     Returns (token_counts, token_costs, total_cost).
     """
     tokens = {
-        "input": 0,
-        "output": 0,
-        "cache_write": 0,
-        "cache_read": 0,
+        "input": sum(_select_rows(scored.input_tokens, rows)),
+        "output": sum(_select_rows(scored.output_tokens, rows)),
+        "cache_write": sum(_select_rows(scored.cache_write_tokens, rows)),
+        "cache_read": sum(_select_rows(scored.cache_read_tokens, rows)),
     }
 
     costs = {
-        "input": 0.0,
-        "output": 0.0,
-        "cache": 0.0,
+        "input": sum(_select_rows(scored.input_costs, rows)),
+        "output": sum(_select_rows(scored.output_costs, rows)),
+        "cache": sum(_select_rows(scored.cache_costs, rows)),
     }
 
-    total_cost = 0.0
-
-    for msg in messages:
-        usage = msg["usage"]
-        model = msg["model"]
-        pricing = get_model_pricing(model)
-
-        if not pricing:
-            continue
-
-        # Input tokens
-        input_tokens = usage.get("input_tokens", 0)
-        tokens["input"] += input_tokens
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        costs["input"] += input_cost
-
-        # Output tokens
-        output_tokens = usage.get("output_tokens", 0)
-        tokens["output"] += output_tokens
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        costs["output"] += output_cost
-
-        # Handle cache write tokens (can be at top level or nested)
-        cache_write = usage.get("cache_creation_input_tokens", 0)
-        if cache_write == 0 and "cache_creation" in usage:
-            cache_creation = usage["cache_creation"]
-            cache_write = cache_creation.get("ephemeral_5m_input_tokens", 0)
-            cache_write += cache_creation.get("ephemeral_1h_input_tokens", 0)
-        tokens["cache_write"] += cache_write
-        cache_write_cost = (cache_write / 1_000_000) * pricing["cache_write"]
-        costs["cache"] += cache_write_cost
-
-        # Cache read tokens
-        cache_read = usage.get("cache_read_input_tokens", 0)
-        tokens["cache_read"] += cache_read
-        cache_read_cost = (cache_read / 1_000_000) * pricing["cache_read"]
-        costs["cache"] += cache_read_cost
-
-        total_cost += input_cost + output_cost + cache_write_cost + cache_read_cost
+    total_cost = costs["input"] + costs["output"] + costs["cache"]
 
     return tokens, costs, total_cost
 
@@ -413,6 +651,12 @@ def main():
         default=7,
         help="Number of days to show in daily view (default: 7)",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="Re-read every session file instead of using the parse cache",
+    )
     args = parser.parse_args()
 
     # Find all JSONL files
@@ -421,41 +665,44 @@ def main():
         print(f"Error: {claude_dir} does not exist", file=sys.stderr)
         sys.exit(1)
 
-    jsonl_files = list(claude_dir.glob("**/*.jsonl"))
+    jsonl_files = list(find_jsonl_files(claude_dir))
 
     if not jsonl_files:
         print("No JSONL files found in ~/.claude/projects/", file=sys.stderr)
         sys.exit(1)
 
-    # Parse all files
-    all_messages = []
-    for file_path in jsonl_files:
-        messages = parse_jsonl_file(file_path)
-        all_messages.extend(messages)
+    # Parse all files, picking up from the cache where possible
+    cached_files = load_cache() if args.cache else {}
+    file_entries = parse_jsonl_files(jsonl_files, cached_files)
+    if args.cache and file_entries != cached_files:
+        save_cache(file_entries)
 
     # Deduplicate
-    all_messages = deduplicate_messages(all_messages)
+    all_messages = deduplicate_messages(entry["messages"] for entry in file_entries.values())
 
     if not all_messages:
         print("No usage data found in JSONL files", file=sys.stderr)
         sys.exit(1)
 
+    # Price every message once; the views below only sum these rows
+    scored = score_messages(all_messages)
+
     now = datetime.now().astimezone()
 
     # Check which view to show
     if args.summary:
         # Categorize by period for summary view
-        categorized = categorize_by_period(all_messages)
-        today_tokens, today_costs, today_total = aggregate_usage(categorized["today"])
-        week_tokens, week_costs, week_total = aggregate_usage(categorized["week"])
-        month_tokens, month_costs, month_total = aggregate_usage(categorized["month"])
+        categorized = categorize_by_period(scored)
+        today_tokens, today_costs, today_total = aggregate_usage(scored, categorized["today"])
+        week_tokens, week_costs, week_total = aggregate_usage(scored, categorized["week"])
+        month_tokens, month_costs, month_total = aggregate_usage(scored, categorized["month"])
         week_start = now - timedelta(days=now.weekday())
 
         # Also get model breakdown for summary
-        model_buckets = categorize_by_model(all_messages)
+        model_buckets = categorize_by_model(scored)
     else:
         # Categorize by day for daily view
-        daily_buckets = categorize_by_day(all_messages, args.days)
+        daily_buckets = categorize_by_day(scored, args.days)
 
     # Output as JSON if requested
     if args.json:
@@ -570,14 +817,14 @@ def main():
 
         # Prepare model breakdown data
         model_data = []
-        for model_name, messages in sorted(model_buckets.items()):
-            model_tokens, model_costs, model_total = aggregate_usage(messages)
+        for model_name, model_rows in sorted(model_buckets.items()):
+            model_tokens, model_costs, model_total = aggregate_usage(scored, model_rows)
             cache_total = model_tokens["cache_write"] + model_tokens["cache_read"]
 
             model_data.append(
                 {
                     "model_name": model_name,
-                    "message_count": len(messages),
+                    "message_count": len(model_rows),
                     "tokens": {
                         "input": model_tokens["input"],
                         "output": model_tokens["output"],
@@ -605,7 +852,7 @@ def main():
             day_key = day_start.strftime("%Y-%m-%d")
 
             if day_key in daily_buckets:
-                day_tokens, day_costs, day_total = aggregate_usage(daily_buckets[day_key])
+                day_tokens, day_costs, day_total = aggregate_usage(scored, daily_buckets[day_key])
                 cache_total_day = day_tokens["cache_write"] + day_tokens["cache_read"]
 
                 daily_data.append(
@@ -0,0 +1,52 @@
+"""On-disk cache of parsed JSONL session files for claude-usage."""
+
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+# Bump whenever the shape of cached entries changes; older caches are discarded.
+CACHE_VERSION = 2
+
+
+def cache_path() -> Path:
+    """Location of the cache file, following XDG_CACHE_HOME when set."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "claude-usage" / "state.pickle"
+
+
+def load_cache() -> dict[str, dict]:
+    """Load cached per-file parse results, or an empty dict if there is no usable cache."""
+    try:
+        with open(cache_path(), "rb") as f:
+            state = pickle.load(f)
+    except Exception:
+        # Missing, unreadable or corrupt caches are simply rebuilt
+        return {}
+
+    if not isinstance(state, dict) or state.get("version") != CACHE_VERSION:
+        return {}
+    return state.get("files", {})
+
+
+def save_cache(files: dict[str, dict]) -> None:
+    """Atomically replace the cache with the given per-file parse results."""
+    path = cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"version": CACHE_VERSION, "files": files},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        print(f"Warning: could not write cache {path}: {e}", file=sys.stderr)
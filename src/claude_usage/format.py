@@ -1,10 +1,19 @@
 """Output formatting for claude-usage."""
 
-from rich.console import Console
+from rich.console import Console, JustifyMethod
 from rich.table import Table
 
 console = Console()
 
+# Columns shared by every usage table: (header, justify, style)
+_USAGE_COLUMNS: list[tuple[str, JustifyMethod, str]] = [
+    ("Input", "right", "green"),
+    ("Output", "right", "green"),
+    ("Cache", "right", "green"),
+    ("Total Tokens", "right", "bold cyan"),
+    ("Cost", "right", "bold yellow"),
+]
+
 
 def format_tokens(n: int) -> str:
     """Format token counts with K/M suffix."""
@@ -15,51 +24,72 @@ def format_tokens(n: int) -> str:
     return f"{n:,}"
 
 
+def _usage_cells(tokens: dict, cost: float) -> list[str]:
+    """Format the token and cost cells shared by every usage table."""
+    return [
+        format_tokens(tokens["input"]),
+        format_tokens(tokens["output"]),
+        format_tokens(tokens["cache"]),
+        format_tokens(tokens["total"]),
+        f"${cost:.2f}",
+    ]
+
+
+def _render_plain(headers: list[str], rows: list[list[str]]) -> None:
+    """Print rows as tab-separated text, for output that isn't going to a terminal."""
+    print("\t".join(headers))
+    for row in rows:
+        print("\t".join(cell.replace("\n", " ") for cell in row))
+
+
+def _print_table(
+    title: str,
+    columns: list[tuple[str, JustifyMethod, str]],
+    rows: list[list[str]],
+    total_row: list[str] | None = None,
+) -> None:
+    """
+    Render rows as a rich table on a terminal. When piped or redirected, skip Rich's
+    measurement and styling passes and print plain tab-separated text instead.
+    """
+    if not console.is_terminal:
+        headers = [header for header, _, _ in columns]
+        _render_plain(headers, rows if total_row is None else [*rows, total_row])
+        return
+
+    table = Table(title=title, show_lines=False)
+    for header, justify, style in columns:
+        table.add_column(header, justify=justify, style=style)
+
+    for row in rows:
+        table.add_row(*row)
+
+    if total_row is not None:
+        table.add_section()
+        table.add_row(*(f"[bold]{cell}[/bold]" for cell in total_row))
+
+    console.print(table)
+
+
 def render_daily_table(daily_data: list[dict]) -> None:
     """Render daily breakdown as a rich table."""
-    table = Table(title="Claude Token Usage - Last 7 Days", show_lines=False)
-
-    table.add_column("Date", style="cyan")
-    table.add_column("Input", justify="right", style="green")
-    table.add_column("Output", justify="right", style="green")
-    table.add_column("Cache", justify="right", style="green")
-    table.add_column("Total Tokens", justify="right", style="bold cyan")
-    table.add_column("Cost", justify="right", style="bold yellow")
-
-    total_input = 0
-    total_output = 0
-    total_cache = 0
-    total_tokens_sum = 0
+    rows = []
+    totals = {"input": 0, "output": 0, "cache": 0, "total": 0}
     total_cost_sum = 0.0
 
     for day in daily_data:
-        table.add_row(
-            day["date_label"],
-            format_tokens(day["tokens"]["input"]),
-            format_tokens(day["tokens"]["output"]),
-            format_tokens(day["tokens"]["cache"]),
-            format_tokens(day["tokens"]["total"]),
-            f"${day['costs']['total']:.2f}",
-        )
-        total_input += day["tokens"]["input"]
-        total_output += day["tokens"]["output"]
-        total_cache += day["tokens"]["cache"]
-        total_tokens_sum += day["tokens"]["total"]
+        rows.append([day["date_label"], *_usage_cells(day["tokens"], day["costs"]["total"])])
+        for key in totals:
+            totals[key] += day["tokens"][key]
         total_cost_sum += day["costs"]["total"]
 
-    # Add total row
-    table.add_section()
-    table.add_row(
-        "[bold]Total[/bold]",
-        f"[bold]{format_tokens(total_input)}[/bold]",
-        f"[bold]{format_tokens(total_output)}[/bold]",
-        f"[bold]{format_tokens(total_cache)}[/bold]",
-        f"[bold]{format_tokens(total_tokens_sum)}[/bold]",
-        f"[bold]${total_cost_sum:.2f}[/bold]",
+    _print_table(
+        "Claude Token Usage - Last 7 Days",
+        [("Date", "left", "cyan"), *_USAGE_COLUMNS],
+        rows,
+        ["Total", *_usage_cells(totals, total_cost_sum)],
     )
 
-    console.print(table)
-
 
 def render_summary_table(
     today_data: dict,
@@ -67,94 +97,45 @@ def render_summary_table(
     month_data: dict,
 ) -> None:
     """Render summary usage data as a rich table."""
-    table = Table(title="Claude Token Usage - Summary", show_lines=False)
-
-    table.add_column("Period", style="cyan")
-    table.add_column("Input", justify="right", style="green")
-    table.add_column("Output", justify="right", style="green")
-    table.add_column("Cache", justify="right", style="green")
-    table.add_column("Total Tokens", justify="right", style="bold cyan")
-    table.add_column("Cost", justify="right", style="bold yellow")
-
-    # Today row
-    table.add_row(
-        f"Today\n{today_data['date_label']}",
-        format_tokens(today_data["tokens"]["input"]),
-        format_tokens(today_data["tokens"]["output"]),
-        format_tokens(today_data["tokens"]["cache"]),
-        format_tokens(today_data["tokens"]["total"]),
-        f"${today_data['costs']['total']:.2f}",
-    )
-
-    # This week row
-    table.add_row(
-        f"This Week\n{week_data['date_label']}",
-        format_tokens(week_data["tokens"]["input"]),
-        format_tokens(week_data["tokens"]["output"]),
-        format_tokens(week_data["tokens"]["cache"]),
-        format_tokens(week_data["tokens"]["total"]),
-        f"${week_data['costs']['total']:.2f}",
-    )
+    rows = [
+        [f"{label}\n{data['date_label']}", *_usage_cells(data["tokens"], data["costs"]["total"])]
+        for label, data in (
+            ("Today", today_data),
+            ("This Week", week_data),
+            ("This Month", month_data),
+        )
+    ]
 
-    # This month row
-    table.add_row(
-        f"This Month\n{month_data['date_label']}",
-        format_tokens(month_data["tokens"]["input"]),
-        format_tokens(month_data["tokens"]["output"]),
-        format_tokens(month_data["tokens"]["cache"]),
-        format_tokens(month_data["tokens"]["total"]),
-        f"${month_data['costs']['total']:.2f}",
+    _print_table(
+        "Claude Token Usage - Summary",
+        [("Period", "left", "cyan"), *_USAGE_COLUMNS],
+        rows,
     )
 
-    console.print(table)
-
 
 def render_model_table(model_data: list[dict]) -> None:
     """Render usage breakdown by model as a rich table."""
-    table = Table(title="Claude Token Usage - By Model", show_lines=False)
-
-    table.add_column("Model", style="cyan")
-    table.add_column("Messages", justify="right", style="blue")
-    table.add_column("Input", justify="right", style="green")
-    table.add_column("Output", justify="right", style="green")
-    table.add_column("Cache", justify="right", style="green")
-    table.add_column("Total Tokens", justify="right", style="bold cyan")
-    table.add_column("Cost", justify="right", style="bold yellow")
-
+    rows = []
     total_messages = 0
-    total_input = 0
-    total_output = 0
-    total_cache = 0
-    total_tokens_sum = 0
+    totals = {"input": 0, "output": 0, "cache": 0, "total": 0}
     total_cost_sum = 0.0
 
     for model in model_data:
-        table.add_row(
-            model["model_name"],
-            f"{model['message_count']:,}",
-            format_tokens(model["tokens"]["input"]),
-            format_tokens(model["tokens"]["output"]),
-            format_tokens(model["tokens"]["cache"]),
-            format_tokens(model["tokens"]["total"]),
-            f"${model['costs']['total']:.2f}",
+        rows.append(
+            [
+                model["model_name"],
+                f"{model['message_count']:,}",
+                *_usage_cells(model["tokens"], model["costs"]["total"]),
+            ]
         )
         total_messages += model["message_count"]
-        total_input += model["tokens"]["input"]
-        total_output += model["tokens"]["output"]
-        total_cache += model["tokens"]["cache"]
-        total_tokens_sum += model["tokens"]["total"]
+        for key in totals:
+            totals[key] += model["tokens"][key]
         total_cost_sum += model["costs"]["total"]
 
-    # Add total row
-    table.add_section()
-    table.add_row(
-        "[bold]Total[/bold]",
-        f"[bold]{total_messages:,}[/bold]",
-        f"[bold]{format_tokens(total_input)}[/bold]",
-        f"[bold]{format_tokens(total_output)}[/bold]",
-        f"[bold]{format_tokens(total_cache)}[/bold]",
-        f"[bold]{format_tokens(total_tokens_sum)}[/bold]",
-        f"[bold]${total_cost_sum:.2f}[/bold]",
+    _print_table(
+        "Claude Token Usage - By Model",
+        [("Model", "left", "cyan"), ("Messages", "right", "blue"), *_USAGE_COLUMNS],
+        rows,
+        ["Total", f"{total_messages:,}", *_usage_cells(totals, total_cost_sum)],
     )
-
-    console.print(table)
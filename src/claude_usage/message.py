@@ -0,0 +1,17 @@
+"""Message records extracted from Claude session files.
+
+Kept out of __main__ so pickled cache entries refer to a stable module path, whether the
+CLI runs as ``claude-usage`` or ``python -m claude_usage``.
+"""
+
+from typing import NamedTuple
+
+
+class UsageMessage(NamedTuple):
+    """An assistant message with usage data, as read from one JSONL line."""
+
+    timestamp: str | None
+    request_id: str | None
+    message_id: str | None
+    model: str | None
+    usage: dict
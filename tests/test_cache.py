@@ -0,0 +1,124 @@
+"""Tests for the incremental parse cache."""
+
+import json
+import pickle
+
+import pytest
+
+from claude_usage.__main__ import parse_jsonl_files
+from claude_usage.cache import CACHE_VERSION, cache_path, load_cache, save_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the cache inside the test's temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def assistant_line(n: int) -> bytes:
+    """A newline-terminated assistant message with usage, unique per n."""
+    entry = {
+        "type": "assistant",
+        "timestamp": f"2025-01-01T00:00:{n:02d}.000Z",
+        "requestId": f"req_{n}",
+        "message": {
+            "id": f"msg_{n}",
+            "model": "claude-sonnet-4-20250514",
+            "usage": {"input_tokens": n, "output_tokens": 2 * n},
+        },
+    }
+    return json.dumps(entry).encode() + b"\n"
+
+
+def cached_run(files: list[str]) -> dict[str, dict]:
+    """Parse files the way main() does with the cache enabled."""
+    entries = parse_jsonl_files(files, load_cache())
+    save_cache(entries)
+    return entries
+
+
+def uncached_run(files: list[str]) -> dict[str, dict]:
+    """Parse files the way main() does with --no-cache."""
+    return parse_jsonl_files(files, {})
+
+
+@pytest.fixture
+def session(tmp_path):
+    """A session file with two complete messages."""
+    path = tmp_path / "session.jsonl"
+    path.write_bytes(assistant_line(1) + assistant_line(2))
+    return path
+
+
+def test_unchanged_file_reuses_cache(session, monkeypatch):
+    files = [str(session)]
+    first = cached_run(files)
+
+    def fail(*args):
+        raise AssertionError("unchanged file was parsed again")
+
+    monkeypatch.setattr("claude_usage.__main__.parse_jsonl_file", fail)
+    assert cached_run(files) == first
+    assert len(first[str(session)]["messages"]) == 2
+
+
+def test_appended_tail_matches_full_parse(session):
+    files = [str(session)]
+    cached_run(files)
+
+    with open(session, "ab") as f:
+        f.write(assistant_line(3))
+
+    entries = cached_run(files)
+    assert entries == uncached_run(files)
+    assert len(entries[str(session)]["messages"]) == 3
+
+
+def test_partial_line_is_parsed_once_complete(session):
+    files = [str(session)]
+    line = assistant_line(3)
+    with open(session, "ab") as f:
+        f.write(line[:20])
+
+    entries = cached_run(files)
+    assert len(entries[str(session)]["messages"]) == 2
+    assert entries[str(session)]["offset"] == session.stat().st_size - 20
+
+    with open(session, "ab") as f:
+        f.write(line[20:])
+
+    entries = cached_run(files)
+    assert entries == uncached_run(files)
+    assert len(entries[str(session)]["messages"]) == 3
+
+
+def test_truncated_file_is_parsed_from_start(session):
+    files = [str(session)]
+    cached_run(files)
+
+    session.write_bytes(assistant_line(4))
+
+    entries = cached_run(files)
+    assert entries == uncached_run(files)
+    assert list(entries[str(session)]["messages"]) == [("msg_4", "req_4")]
+
+
+def test_version_mismatch_discards_cache(session):
+    cached_run([str(session)])
+    assert load_cache()
+
+    with open(cache_path(), "rb") as f:
+        state = pickle.load(f)
+    state["version"] = CACHE_VERSION - 1
+    with open(cache_path(), "wb") as f:
+        pickle.dump(state, f)
+
+    assert load_cache() == {}
+
+
+def test_state_without_files_loads_empty():
+    cache_path().parent.mkdir(parents=True)
+    with open(cache_path(), "wb") as f:
+        pickle.dump({"version": CACHE_VERSION}, f)
+
+    assert load_cache() == {}